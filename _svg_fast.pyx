@@ -0,0 +1,37 @@
+# cython: language_level=3
+# Optional compiled fast path for polyline point formatting.
+# Build in place with:
+#
+#     python setup.py build_ext --inplace
+#
+# render.py falls back to its pure-Python formatter when this module
+# has not been built.
+
+from libc.stdio cimport snprintf
+
+
+cpdef str format_points(list points):
+    """Render [(x, y), ...] as the SVG "x,y x,y ..." points string."""
+    cdef char buf[64]
+    cdef bytearray out = bytearray()
+    cdef Py_ssize_t n
+    cdef bint first = True
+    cdef object px, py
+    for pt in points:
+        px = pt[0]
+        py = pt[1]
+        if not first:
+            out += b" "
+        first = False
+        if isinstance(px, int):
+            n = snprintf(buf, sizeof(buf), b"%lld", <long long> px)
+        else:
+            n = snprintf(buf, sizeof(buf), b"%.12g", <double> px)
+        out += buf[:n]
+        out += b","
+        if isinstance(py, int):
+            n = snprintf(buf, sizeof(buf), b"%lld", <long long> py)
+        else:
+            n = snprintf(buf, sizeof(buf), b"%.12g", <double> py)
+        out += buf[:n]
+    return out.decode("ascii")
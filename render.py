@@ -1,169 +1,309 @@
 #!/usr/bin/env python3
-import json
+import argparse
 import math
+import re
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from io import StringIO, TextIOWrapper
 from pathlib import Path
 
+try:
+    # Optional C JSON parser; stdlib json handles the same documents.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_SAFE_TEXT = re.compile(r'[^&<>"\']*').fullmatch
+_ESC_TRANS = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+
+_COORD_STR = tuple(str(i) for i in range(2048))
+
+_SVG_OPEN = (
+    "<svg xmlns='http://www.w3.org/2000/svg' "
+    "xmlns:xlink='http://www.w3.org/1999/xlink' width='"
+)
+_G_ROADS = "<g fill='none' stroke-linecap='round' stroke-linejoin='round'>"
+_G_PLAIN = "<g>"
+_G_CLOSE = "</g>"
+
+_DECO_DEFAULTS = {
+    "type": "polyline",
+    "stroke": "#111111",
+    "width": 2,
+    "linecap": "round",
+    "linejoin": "round",
+    "fill": "none",
+}
+
 def svg_header(width, height):
-    return (
-        f"<svg xmlns='http://www.w3.org/2000/svg' "
-        f"xmlns:xlink='http://www.w3.org/1999/xlink' "
-        f"width='{width}' height='{height}' viewBox='0 0 {width} {height}'>"
-    )
+    w, h = str(width), str(height)
+    return _SVG_OPEN + w + "' height='" + h + "' viewBox='0 0 " + w + " " + h + "'>"
 
+@lru_cache(maxsize=4096)
 def escape(text):
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    if _SAFE_TEXT(text):
+        return text
+    return text.translate(_ESC_TRANS)
 
-def render(data):
-    meta = data["meta"]
-    style = data["style"]
-    width = meta["width"]
-    height = meta["height"]
-    groups = {g["id"]: g for g in data.get("groups", [])}
+def _c(v):
+    """str(v), via a lookup table for small integral coordinates."""
+    iv = int(v)
+    if 0 <= iv < 2048 and iv == v:
+        return _COORD_STR[iv]
+    return str(v)
 
-    parts = [svg_header(width, height)]
-    parts.append(
-        f"<rect width='{width}' height='{height}' fill='{meta['background']}'/>"
-    )
+def _fmt_points(pts):
+    return " ".join(_c(x) + "," + _c(y) for x, y in pts)
+
+try:
+    # Compiled fast path; build with `python setup.py build_ext --inplace`.
+    from _svg_fast import format_points as _fmt_points
+except ImportError:
+    pass
 
+try:
+    # Optional; only used to vectorize work on large keys.
+    import numpy as _np
+except ImportError:
+    _np = None
+
+def _render_roads(data, style):
     # Roads (tube-style straight polylines)
-    parts.append(
-        "<g fill='none' stroke-linecap='round' stroke-linejoin='round'>"
-    )
+    road_stroke = style["road_stroke"]
+    # Stroke width is constant per render; bake it into the template tail.
+    road_tail = f"' stroke-width='{style['road_width']}'/>\n"
+    buf = StringIO()
+    w = buf.write
+    w(_G_ROADS)
+    w("\n")
     for road in data.get("roads", []):
-        pts = " ".join(f"{x},{y}" for x, y in road["points"])
-        color = road.get("color", style["road_stroke"])
-        parts.append(
-            f"<polyline points='{pts}' stroke='{color}' stroke-width='{style['road_width']}'/>"
-        )
-    parts.append("</g>")
+        w("".join((
+            "<polyline points='", _fmt_points(road["points"]),
+            "' stroke='", road.get("color", road_stroke), road_tail,
+        )))
+    w(_G_CLOSE)
+    w("\n")
+    return buf.getvalue()
 
+def _render_plots(data, style, groups):
     # Plot markers
-    parts.append("<g>")
+    plot_fill = style["plot_fill"]
+    plot_text = style["plot_text"]
+    plot_stroke = style["plot_stroke"]
+    plot_size = style.get("plot_size", 24)
+    label_font = style["label_font"]
+    name_font = style["name_font"]
+    label_text = style["label_text"]
+    group_style = {
+        gid: {"fill": g["color"], "text": g.get("text", "#ffffff")}
+        for gid, g in groups.items()
+    }
+    group_style[None] = {"fill": plot_fill, "text": plot_text}
+    # Constant template chunks: only x/y/colors vary per plot, so join
+    # prebuilt pieces instead of re-expanding full f-strings each time.
+    half_size = plot_size / 2
+    rect_mid = f"' width='{plot_size}' height='{plot_size}' rx='4' fill='"
+    rect_end = f"' stroke='{plot_stroke}' stroke-width='2'/>\n"
+    text_mid = "' text-anchor='middle' font-weight='700'"
+    name_mid = f"' font-family='{name_font}' font-size='14' fill='{label_text}'>"
+    buf = StringIO()
+    w = buf.write
+    # Common label attributes live on the group; plots only emit fill when
+    # it differs from the inherited default.
+    w(f"<g fill='#ffffff' font-family='{label_font}' font-size='12'>")
+    w("\n")
     for plot in data.get("plots", []):
         x, y = plot["x"], plot["y"]
         label = escape(plot["id"])
-        group_id = plot.get("group")
-        group = groups.get(group_id)
-        fill = group["color"] if group else style["plot_fill"]
-        text_color = group.get("text", "#ffffff") if group else style["plot_text"]
-        plot_size = style.get("plot_size", 24)
-        parts.append(
-            f"<rect x='{x - plot_size / 2}' y='{y - plot_size / 2}' "
-            f"width='{plot_size}' height='{plot_size}' rx='4' "
-            f"fill='{fill}' stroke='{style['plot_stroke']}' stroke-width='2'/>"
-        )
-        parts.append(
-            f"<text x='{x}' y='{y + 6}' text-anchor='middle' "
-            f"font-family='{style['label_font']}' font-size='12' font-weight='700' "
-            f"fill='{text_color}'>{label}</text>"
-        )
+        gs = group_style.get(plot.get("group"), group_style[None])
+        fill = gs["fill"]
+        text_color = gs["text"]
+        w("".join((
+            "<rect x='", _c(x - half_size), "' y='", _c(y - half_size),
+            rect_mid, fill, rect_end,
+        )))
+        if text_color == "#ffffff":
+            w("".join((
+                "<text x='", _c(x), "' y='", _c(y + 6),
+                text_mid, ">", label, "</text>\n",
+            )))
+        else:
+            w("".join((
+                "<text x='", _c(x), "' y='", _c(y + 6),
+                text_mid, " fill='", text_color, "'>", label, "</text>\n",
+            )))
         if plot.get("name"):
             name = escape(plot["name"])
-            parts.append(
-                f"<text x='{x + 18}' y='{y + 4}' font-family='{style['name_font']}' "
-                f"font-size='14' fill='{style['label_text']}'>{name}</text>"
-            )
-    parts.append("</g>")
+            w("".join((
+                "<text x='", _c(x + 18), "' y='", _c(y + 4),
+                name_mid, name, "</text>\n",
+            )))
+    w(_G_CLOSE)
+    w("\n")
+    return buf.getvalue()
 
+def _render_decorations(data):
     # Decorations (thin lines, arrows, shapes)
     decorations = data.get("decorations", [])
-    if decorations:
-        parts.append("<g>")
-        for deco in decorations:
-            dtype = deco.get("type", "polyline")
-            stroke = deco.get("stroke", "#111111")
-            width = deco.get("width", 2)
-            linecap = deco.get("linecap", "round")
-            linejoin = deco.get("linejoin", "round")
-            fill = deco.get("fill", "none")
-            if dtype == "polyline":
-                pts = " ".join(f"{x},{y}" for x, y in deco["points"])
-                parts.append(
-                    f"<polyline points='{pts}' stroke='{stroke}' stroke-width='{width}' "
-                    f"fill='{fill}' stroke-linecap='{linecap}' stroke-linejoin='{linejoin}'/>"
-                )
-            elif dtype == "polygon":
-                pts = " ".join(f"{x},{y}" for x, y in deco["points"])
-                parts.append(
-                    f"<polygon points='{pts}' stroke='{stroke}' stroke-width='{width}' fill='{fill}' "
-                    f"stroke-linejoin='{linejoin}'/>"
-                )
-            elif dtype == "line":
-                parts.append(
-                    f"<line x1='{deco['x1']}' y1='{deco['y1']}' x2='{deco['x2']}' y2='{deco['y2']}' "
-                    f"stroke='{stroke}' stroke-width='{width}' stroke-linecap='{linecap}'/>"
-                )
-            elif dtype == "circle":
-                parts.append(
-                    f"<circle cx='{deco['cx']}' cy='{deco['cy']}' r='{deco['r']}' "
-                    f"stroke='{stroke}' stroke-width='{width}' fill='{fill}'/>"
-                )
-            elif dtype == "image":
-                href = deco.get("href")
-                if not href:
-                    continue
-                parts.append(
-                    f"<image href='{href}' x='{deco['x']}' y='{deco['y']}' "
-                    f"width='{deco['width']}' height='{deco['height']}' "
-                    f"preserveAspectRatio='{deco.get('preserve', 'xMidYMid meet')}'/>"
-                )
-        parts.append("</g>")
+    if not decorations:
+        return ""
+    buf = StringIO()
+    w = buf.write
+    w(_G_PLAIN)
+    w("\n")
+    for deco in decorations:
+        deco = _DECO_DEFAULTS | deco
+        dtype = deco["type"]
+        stroke = deco["stroke"]
+        width = deco["width"]
+        linecap = deco["linecap"]
+        linejoin = deco["linejoin"]
+        fill = deco["fill"]
+        if dtype == "polyline":
+            pts = _fmt_points(deco["points"])
+            w(
+                f"<polyline points='{pts}' stroke='{stroke}' stroke-width='{width}' "
+                f"fill='{fill}' stroke-linecap='{linecap}' stroke-linejoin='{linejoin}'/>"
+            )
+            w("\n")
+        elif dtype == "polygon":
+            pts = _fmt_points(deco["points"])
+            w(
+                f"<polygon points='{pts}' stroke='{stroke}' stroke-width='{width}' fill='{fill}' "
+                f"stroke-linejoin='{linejoin}'/>"
+            )
+            w("\n")
+        elif dtype == "line":
+            w(
+                f"<line x1='{_c(deco['x1'])}' y1='{_c(deco['y1'])}' x2='{_c(deco['x2'])}' y2='{_c(deco['y2'])}' "
+                f"stroke='{stroke}' stroke-width='{width}' stroke-linecap='{linecap}'/>"
+            )
+            w("\n")
+        elif dtype == "circle":
+            w(
+                f"<circle cx='{_c(deco['cx'])}' cy='{_c(deco['cy'])}' r='{_c(deco['r'])}' "
+                f"stroke='{stroke}' stroke-width='{width}' fill='{fill}'/>"
+            )
+            w("\n")
+        elif dtype == "image":
+            href = deco.get("href")
+            if not href:
+                continue
+            w(
+                f"<image href='{href}' x='{deco['x']}' y='{deco['y']}' "
+                f"width='{deco['width']}' height='{deco['height']}' "
+                f"preserveAspectRatio='{deco.get('preserve', 'xMidYMid meet')}'/>"
+            )
+            w("\n")
+    w(_G_CLOSE)
+    w("\n")
+    return buf.getvalue()
+
+@dataclass(slots=True)
+class _Label:
+    """A label dict with its defaults resolved, for attribute access."""
+
+    x: float
+    y: float
+    size: int
+    color: str
+    font: str
+    anchor: str | None
+    weight: str
+    rotate: float | None
+    spans: list | None
+    lines: list | None
+    line_height: int
+    text: str | None
+
+
+def _make_label(d, label_font, label_text):
+    size = d.get("size", 16)
+    return _Label(
+        d["x"],
+        d["y"],
+        size,
+        d.get("color", label_text),
+        d.get("font", label_font),
+        d.get("anchor"),
+        d.get("weight", "700"),
+        d.get("rotate"),
+        d.get("spans"),
+        d.get("lines"),
+        d.get("line_height", size + 4),
+        d.get("text"),
+    )
+
 
+def _render_labels(data, style):
     # Labels
-    parts.append("<g>")
-    for label in data.get("labels", []):
-        size = label.get("size", 16)
-        color = label.get("color", style["label_text"])
-        font = label.get("font", style["label_font"])
-        anchor = label.get("anchor")
-        weight = label.get("weight", "700")
-        rotate = label.get("rotate")
+    label_font = style["label_font"]
+    label_text = style["label_text"]
+    buf = StringIO()
+    w = buf.write
+    w(_G_PLAIN)
+    w("\n")
+    for d in data.get("labels", []):
+        lab = _make_label(d, label_font, label_text)
         attrs = [
-            f"x='{label['x']}'",
-            f"y='{label['y']}'",
-            f"font-family='{font}'",
-            f"font-size='{size}'",
-            f"fill='{color}'",
+            f"x='{lab.x}'",
+            f"y='{lab.y}'",
+            f"font-family='{lab.font}'",
+            f"font-size='{lab.size}'",
+            f"fill='{lab.color}'",
         ]
-        if anchor:
-            attrs.append(f"text-anchor='{anchor}'")
-        if weight:
-            attrs.append(f"font-weight='{weight}'")
-        if rotate:
-            attrs.append(f"transform='rotate({rotate} {label['x']} {label['y']})'")
-        spans = label.get("spans")
-        if spans:
-            parts.append(f"<text {' '.join(attrs)}>")
-            for span in spans:
-                span_x = span.get("x", label["x"])
-                span_y = span.get("y", label["y"])
-                parts.append(
+        if lab.anchor:
+            attrs.append(f"text-anchor='{lab.anchor}'")
+        if lab.weight:
+            attrs.append(f"font-weight='{lab.weight}'")
+        if lab.rotate:
+            attrs.append(f"transform='rotate({lab.rotate} {lab.x} {lab.y})'")
+        if lab.spans:
+            w(f"<text {' '.join(attrs)}>")
+            w("\n")
+            for span in lab.spans:
+                span_x = span.get("x", lab.x)
+                span_y = span.get("y", lab.y)
+                w(
                     f"<tspan x='{span_x}' y='{span_y}'>{escape(str(span.get('text', '')))}</tspan>"
                 )
-            parts.append("</text>")
+                w("\n")
+            w("</text>")
+            w("\n")
+        elif lab.lines:
+            w(f"<text {' '.join(attrs)}>")
+            w("\n")
+            for idx, line in enumerate(lab.lines):
+                y = lab.y + idx * lab.line_height
+                w(
+                    f"<tspan x='{lab.x}' y='{y}'>{escape(str(line))}</tspan>"
+                )
+                w("\n")
+            w("</text>")
+            w("\n")
         else:
-            lines = label.get("lines")
-            if lines:
-                line_height = label.get("line_height", size + 4)
-                parts.append(f"<text {' '.join(attrs)}>")
-                for idx, line in enumerate(lines):
-                    y = label["y"] + idx * line_height
-                    parts.append(
-                        f"<tspan x='{label['x']}' y='{y}'>{escape(str(line))}</tspan>"
-                    )
-                parts.append("</text>")
-            else:
-                text = escape(label["text"])
-                parts.append(f"<text {' '.join(attrs)}>{text}</text>")
-    parts.append("</g>")
+            text = escape(lab.text)
+            w(f"<text {' '.join(attrs)}>{text}</text>")
+            w("\n")
+    w(_G_CLOSE)
+    w("\n")
+    return buf.getvalue()
+
+def _render_key_legend(data, style, groups):
+    buf = StringIO()
+    w = buf.write
+    label_font = style["label_font"]
+    label_text = style["label_text"]
 
     # Key (simple list of colored labels)
     key = data.get("key")
@@ -183,16 +323,22 @@ def render(data):
         if not rows_per_col:
             rows_per_col = math.ceil(len(items) / columns)
 
-        col_widths = [0] * columns
+        texts = [escape(item.get("text", "")) for item in items]
         if column_width:
-            for col in range(columns):
-                col_widths[col] = column_width
+            col_widths = [column_width] * columns
+        elif _np is not None and len(items) > 64:
+            lens = _np.fromiter(map(len, texts), dtype=_np.int64, count=len(texts))
+            rect_ws = _np.maximum(40, lens * char_width) + pad_x * 2
+            cols = _np.minimum(_np.arange(len(items)) // rows_per_col, columns - 1)
+            widths = _np.zeros(columns, dtype=rect_ws.dtype)
+            _np.maximum.at(widths, cols, rect_ws)
+            col_widths = widths.tolist()
         else:
-            for idx, item in enumerate(items):
+            col_widths = [0] * columns
+            for idx, text in enumerate(texts):
                 col = idx // rows_per_col
                 if col >= columns:
                     col = columns - 1
-                text = escape(item.get("text", ""))
                 rect_w = max(40, len(text) * char_width) + pad_x * 2
                 if rect_w > col_widths[col]:
                     col_widths[col] = rect_w
@@ -203,12 +349,13 @@ def render(data):
             col_offsets[col] = running
             running += col_widths[col] + column_gap
 
-        parts.append("<g>")
+        w(_G_PLAIN)
+        w("\n")
         for idx, item in enumerate(items):
-            text = escape(item.get("text", ""))
+            text = texts[idx]
             if not text:
                 continue
-            color = item.get("color", style["label_text"])
+            color = item.get("color", label_text)
             col = idx // rows_per_col
             row = idx % rows_per_col
             if col >= columns:
@@ -218,70 +365,208 @@ def render(data):
             rect_w = max(40, len(text) * char_width) + pad_x * 2
             rect_h = font_size + pad_y * 2
             rect_y = y - rect_h / 2
-            parts.append(
+            w(
                 f"<rect x='{x}' y='{rect_y}' width='{rect_w}' height='{rect_h}' rx='4' "
                 f"fill='{color}'/>"
             )
-            parts.append(
+            w("\n")
+            w(
                 f"<text x='{x + rect_w / 2}' y='{y}' text-anchor='middle' dominant-baseline='middle' "
-                f"font-family='{style['label_font']}' font-size='{font_size}' font-weight='700' "
+                f"font-family='{label_font}' font-size='{font_size}' font-weight='700' "
                 f"fill='#111111'>{text}</text>"
             )
-        parts.append("</g>")
+            w("\n")
+        w(_G_CLOSE)
+        w("\n")
 
     # Legend
     legend = data.get("legend")
     if legend:
+        legend_font = style["legend_font"]
+        plot_stroke = style["plot_stroke"]
         lx = legend["x"]
         ly = legend["y"]
         swatch = legend.get("swatch", 14)
         item_height = legend.get("item_height", 22)
-        parts.append("<g>")
-        parts.append(
-            f"<text x='{lx}' y='{ly}' font-family='{style['legend_font']}' "
-            f"font-size='18' fill='{style['label_text']}'>{escape(legend.get('title', 'Legend'))}</text>"
+        w(_G_PLAIN)
+        w("\n")
+        w(
+            f"<text x='{lx}' y='{ly}' font-family='{legend_font}' "
+            f"font-size='18' fill='{label_text}'>{escape(legend.get('title', 'Legend'))}</text>"
         )
+        w("\n")
         for idx, item in enumerate(legend.get("items", [])):
             group = groups.get(item.get("group"))
             if not group:
                 continue
             y = ly + 12 + (idx + 1) * item_height
-            parts.append(
+            w(
                 f"<rect x='{lx}' y='{y - swatch + 4}' width='{swatch}' height='{swatch}' rx='3' "
-                f"fill='{group['color']}' stroke='{style['plot_stroke']}' stroke-width='1'/>"
+                f"fill='{group['color']}' stroke='{plot_stroke}' stroke-width='1'/>"
             )
+            w("\n")
             label = escape(item.get("label", ""))
-            parts.append(
-                f"<text x='{lx + swatch + 8}' y='{y + 4}' font-family='{style['legend_font']}' "
-                f"font-size='14' fill='{style['label_text']}'>{group['name']}: {label}</text>"
+            w(
+                f"<text x='{lx + swatch + 8}' y='{y + 4}' font-family='{legend_font}' "
+                f"font-size='14' fill='{label_text}'>{group['name']}: {label}</text>"
             )
-        parts.append("</g>")
+            w("\n")
+        w(_G_CLOSE)
+        w("\n")
+
+    return buf.getvalue()
 
-    parts.append("</svg>")
-    return "\n".join(parts) + "\n"
+def render(data, out):
+    """Write the SVG document for *data* to the text stream *out*."""
+    meta = data["meta"]
+    style = data["style"]
+    width = meta["width"]
+    height = meta["height"]
+    groups = {g["id"]: g for g in data.get("groups", [])}
 
+    w = out.write
+    w(svg_header(width, height))
+    w("\n")
+    w(f"<rect width='{width}' height='{height}' fill='{meta['background']}'/>\n")
 
-def main():
-    map_path = Path("map.yaml")
-    data = json.loads(map_path.read_text())
-    svg = render(data)
-    Path("output.svg").write_text(svg)
-    print("Rendered output.svg from map.yaml")
+    # The sections are independent string builders; render them
+    # concurrently and stream the fragments out in document order.
+    sections = (
+        (_render_roads, (data, style)),
+        (_render_plots, (data, style, groups)),
+        (_render_decorations, (data,)),
+        (_render_labels, (data, style)),
+        (_render_key_legend, (data, style, groups)),
+    )
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(fn, *args) for fn, args in sections]
+        for future in futures:
+            w(future.result())
 
-    converter = shutil.which("rsvg-convert")
-    if converter:
-        png_zoom = data.get("meta", {}).get("png_zoom", 2)
+    w("</svg>\n")
+
+
+class _Tee:
+    """Duplicate writes across several text streams."""
+
+    def __init__(self, streams):
+        self.streams = streams
+
+    def write(self, text):
+        for stream in self.streams:
+            stream.write(text)
+
+
+class _PipeStream:
+    """Write to a subprocess pipe, absorbing broken-pipe failures.
+
+    If the process exits early its pipe raises BrokenPipeError; record
+    the failure and drop further writes so a teed sibling stream still
+    receives the complete document.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.failed = False
+
+    def write(self, text):
+        if self.failed:
+            return
         try:
-            subprocess.run(
-                [converter, "output.svg", "-o", "output.png", "--zoom", str(png_zoom)],
-                check=True,
-            )
-            print("Rendered output.png from output.svg")
-        except subprocess.CalledProcessError as exc:
-            print(f"Failed to render output.png: {exc}")
+            self.stream.write(text)
+        except OSError:
+            self.failed = True
+
+    def close(self):
+        try:
+            self.stream.close()
+        except OSError:
+            self.failed = True
+
+
+def _render_once(map_path, converter):
+    data = _json_loads(map_path.read_bytes())
+    meta = data.get("meta", {})
+    write_svg = meta.get("write_svg", True)
+
+    proc = None
+    streams = []
+    if write_svg:
+        streams.append(open("output.svg", "w", buffering=1 << 20))
+    if converter:
+        # Feed rsvg-convert over stdin so it parses while we render,
+        # instead of waiting on a finished output.svg on disk.
+        png_zoom = meta.get("png_zoom", 2)
+        proc = subprocess.Popen(
+            [converter, "-", "-o", "output.png", "--zoom", str(png_zoom)],
+            stdin=subprocess.PIPE,
+        )
+        pipe = _PipeStream(TextIOWrapper(proc.stdin, encoding="utf-8"))
+        streams.append(pipe)
+
+    if not streams:
+        print("write_svg disabled and rsvg-convert not found; nothing to render")
+        return
+
+    out = streams[0] if len(streams) == 1 else _Tee(streams)
+    try:
+        render(data, out)
+    finally:
+        for stream in streams:
+            stream.close()
+
+    if write_svg:
+        print("Rendered output.svg from map.yaml")
+    if proc:
+        returncode = proc.wait()
+        if returncode == 0 and not pipe.failed:
+            print("Rendered output.png from map.yaml")
+        elif returncode != 0:
+            print(f"Failed to render output.png: rsvg-convert exited with {returncode}")
+        else:
+            print("Failed to render output.png: rsvg-convert stopped reading input")
     else:
         print("rsvg-convert not found; skipping output.png")
 
 
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render output.svg/output.png from map.yaml"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="stay running and re-render whenever map.yaml changes",
+    )
+    args = parser.parse_args()
+
+    map_path = Path("map.yaml")
+    # Discover the converter once; watch mode reuses it across renders.
+    converter = shutil.which("rsvg-convert")
+    _render_once(map_path, converter)
+    if not args.watch:
+        return
+
+    print("Watching map.yaml for changes (Ctrl-C to stop)")
+    last_mtime = map_path.stat().st_mtime_ns
+    try:
+        while True:
+            time.sleep(0.5)
+            try:
+                mtime = map_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if mtime != last_mtime:
+                last_mtime = mtime
+                try:
+                    _render_once(map_path, converter)
+                except Exception as exc:
+                    # Half-written saves are routine for a polling
+                    # watcher; report and wait for the next change.
+                    print(f"Render failed: {exc}")
+    except KeyboardInterrupt:
+        pass
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# Builds the optional _svg_fast extension:
+#
+#     python setup.py build_ext --inplace
+#
+# render.py works without it; the extension only speeds up point
+# formatting for point-heavy maps.
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="plot-map-svg-fast",
+    ext_modules=cythonize("_svg_fast.pyx"),
+)